@@ -5,6 +5,7 @@ Copies hook files to ~/.claude/hooks/tts/, installs the /voice skill, and patche
 """
 
 import argparse
+import hashlib
 import json
 import os
 import shutil
@@ -24,6 +25,21 @@ KOKORO_MODEL_URLS = [
         'voices-v1.0.bin',
     ),
 ]
+# Pinned SHA-256 of the model-files-v1.0 release assets. None = not pinned yet: such a
+# file is UNVERIFIED -- only its length is checked (see DOWNLOAD_RECORD_NAME), so a
+# corrupt segment of the right length is not caught. The installer warns when it
+# accepts an unpinned file.
+KOKORO_MODEL_SHA256 = {
+    'kokoro-v1.0.onnx': None,
+    'voices-v1.0.bin': None,
+}
+DOWNLOAD_SEGMENTS = 4        # ranged requests per file (each resumes from its own .part file)
+DOWNLOAD_WORKERS  = 8        # concurrent connections across all files
+DOWNLOAD_CHUNK    = 1 << 20
+DOWNLOAD_TIMEOUT  = 60
+# Per-models-dir record of each download: url, server-reported size, ETag/Last-Modified,
+# and whether it completed. A model only counts as installed if its size matches here.
+DOWNLOAD_RECORD_NAME = 'downloads.json'
 
 # voices.json is excluded from HOOK_FILES -- handled separately to avoid clobbering customizations
 HOOK_FILES = ['daemon.py', 'stop.py', 'task-hook.py', 'repeat.py', 'statusline.py', 'CLAUDE_SNIPPET.md']
@@ -46,6 +62,11 @@ SETTINGS_FILE     = os.path.join(_proj_claude, 'settings.local.json')
 
 GLOBAL_SCOPE = False
 
+# Install manifest: file hashes, package versions and settings written by the last
+# run. Lets a reinstall skip pip, unchanged files and an unchanged settings.json.
+MANIFEST_NAME = 'install-manifest.json'
+_manifest = {'files': {}, 'packages': {}, 'models': {}, 'settings': {}}
+
 
 def step(msg):
     print(f'\n  {msg}')
@@ -75,6 +96,71 @@ def check_python():
         ok(f'Python {vi.major}.{vi.minor}.{vi.micro}')
 
 
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for buf in iter(lambda: f.read(DOWNLOAD_CHUNK), b''):
+            h.update(buf)
+    return h.hexdigest()
+
+
+def _stat_key(path):
+    """Cheap change detector for an installed file: [size, mtime_ns], or None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def load_manifest():
+    global _manifest
+    try:
+        with open(os.path.join(INSTALL_DIR, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            _manifest = json.load(f)
+    except (OSError, ValueError):
+        _manifest = {}
+    if not isinstance(_manifest, dict):
+        _manifest = {}
+    for key in ('files', 'packages', 'models', 'settings'):
+        if not isinstance(_manifest.get(key), dict):
+            _manifest[key] = {}
+
+
+def save_manifest():
+    """Write the manifest atomically (temp file + rename) so a crash never leaves it half-written."""
+    path = os.path.join(INSTALL_DIR, MANIFEST_NAME)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(_manifest, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _copy_if_changed(src, dst):
+    """Copy src to dst unless the manifest shows dst already holds this exact content.
+
+    Returns True if the file was copied."""
+    digest = _sha256_file(src)
+    record = _manifest['files'].get(dst)
+    if record and record.get('sha256') == digest and record.get('stat') == _stat_key(dst):
+        return False
+    shutil.copy2(src, dst)
+    _manifest['files'][dst] = {'sha256': digest, 'stat': _stat_key(dst)}
+    return True
+
+
+def _missing_packages(packages):
+    """Return the packages not installed for this interpreter, recording versions of the rest."""
+    from importlib import metadata
+    missing = []
+    for name in packages:
+        try:
+            _manifest['packages'][name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            missing.append(name)
+    return missing
+
+
 def pip_install(packages):
     cmd = [sys.executable, '-m', 'pip', 'install'] + packages
     result = subprocess.run(cmd, capture_output=True, text=True)
@@ -85,8 +171,13 @@ def pip_install(packages):
 
 def install_packages():
     step(f'Installing required packages: {", ".join(REQUIRED_PACKAGES)}')
-    pip_install(REQUIRED_PACKAGES)
-    ok('edge-tts, miniaudio, sounddevice, cffi installed')
+    missing = _missing_packages(REQUIRED_PACKAGES)
+    if not missing:
+        ok('already installed -- skipping pip')
+        return
+    pip_install(missing)
+    _missing_packages(missing)
+    ok(f'{", ".join(missing)} installed')
 
 
 def create_dirs():
@@ -103,15 +194,17 @@ def copy_files():
         if not os.path.exists(src):
             fail(f'Source file not found: {src}')
             sys.exit(1)
-        shutil.copy2(src, dst)
-        ok(filename)
+        ok(filename if _copy_if_changed(src, dst) else f'{filename} (unchanged)')
 
     # .gitignore: written inline (npm always strips dotfiles from packages)
+    # cache/ is reserved for the daemon's synthesized-audio cache; nothing here creates it
     gitignore_dst = os.path.join(INSTALL_DIR, '.gitignore')
     gitignore_content = (
         '# Runtime state — generated when the daemon runs, not for version control\n'
         'on\nlast.txt\ndaemon.log\ndebug.log\ntask-hook.log\npid\ndaemon.pid\n'
-        'models/\nstatusline_chain.txt\nsessions.json\n'
+        'models/\ncache/\nsessions.json\n'
+        '# Written by the installer -- machine-specific, not for version control\n'
+        'statusline_chain.txt\ninstall-manifest.json\nvoices.index.json\n'
     )
     with open(gitignore_dst, 'w', encoding='utf-8') as f:
         f.write(gitignore_content)
@@ -125,6 +218,7 @@ def copy_files():
     else:
         shutil.copy2(voices_src, voices_dst)
         ok('voices.json')
+    _refresh_voices_index(voices_dst)
 
 
 def copy_skill():
@@ -136,8 +230,7 @@ def copy_skill():
         if not os.path.exists(src):
             warn(f'Skill file not found: {src} -- skipping')
             continue
-        shutil.copy2(src, dst)
-        ok(filename)
+        ok(filename if _copy_if_changed(src, dst) else f'{filename} (unchanged)')
 
 
 def enable_tts():
@@ -150,13 +243,257 @@ def enable_tts():
 KOKORO_GLOBAL_MODELS = os.path.join(_home_claude, 'hooks', 'tts', 'models')
 
 
+def _load_download_record(dest_dir):
+    try:
+        with open(os.path.join(dest_dir, DOWNLOAD_RECORD_NAME), 'r', encoding='utf-8') as f:
+            record = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return record if isinstance(record, dict) else {}
+
+
+def _save_download_record(dest_dir, record):
+    path = os.path.join(dest_dir, DOWNLOAD_RECORD_NAME)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(record, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _completed_size(record, filename):
+    """Size recorded for a finished download of filename, or None if it never completed."""
+    entry = record.get(filename)
+    if isinstance(entry, dict) and entry.get('complete'):
+        return entry.get('size')
+    return None
+
+
+def _model_file_ok(path, sha256, expected_size):
+    """True if a model file has the expected size and matches its pinned digest (when one is pinned)."""
+    stat = _stat_key(path)
+    if expected_size is None or stat is None or stat[0] != expected_size:
+        return False
+    if sha256 is None:
+        return True
+    # Hashing ~340MB takes a while -- reuse the digest recorded for an unmodified file
+    record = _manifest['models'].get(path)
+    if not record or record.get('stat') != stat:
+        record = {'sha256': _sha256_file(path), 'stat': stat}
+        _manifest['models'][path] = record
+    return record['sha256'] == sha256
+
+
 def _kokoro_already_installed():
-    """True if kokoro-onnx is importable and model files exist in the global models dir."""
+    """True if kokoro-onnx is importable and complete model files exist in the global models dir."""
     import importlib.util
     if importlib.util.find_spec('kokoro_onnx') is None:
         return False
-    return all(os.path.exists(os.path.join(KOKORO_GLOBAL_MODELS, f))
-               for f in ('kokoro-v1.0.onnx', 'voices-v1.0.bin'))
+    record = _load_download_record(KOKORO_GLOBAL_MODELS)
+    return all(_model_file_ok(os.path.join(KOKORO_GLOBAL_MODELS, f), KOKORO_MODEL_SHA256.get(f),
+                              _completed_size(record, f))
+               for _, f in KOKORO_MODEL_URLS)
+
+
+def _probe_download(url):
+    """Return (total_size, ranged, validator) for url.
+
+    ranged is True if the server honours Range requests; validator is the ETag (or
+    Last-Modified) identifying this version of the asset, or None."""
+    import urllib.request
+    req = urllib.request.Request(url, headers={'Range': 'bytes=0-0'})
+    with urllib.request.urlopen(req, timeout=DOWNLOAD_TIMEOUT) as resp:
+        validator = resp.headers.get('ETag') or resp.headers.get('Last-Modified')
+        if resp.status == 206:
+            total = resp.headers.get('Content-Range', '').rpartition('/')[2]
+            return (int(total), True, validator) if total.isdigit() else (None, False, validator)
+        length = resp.headers.get('Content-Length', '')
+        return (int(length) if length.isdigit() else None), False, validator
+
+
+def _plan_segments(dst, total, ranged):
+    """Split a download into (part_path, start, end) byte ranges. end is None for a plain GET."""
+    if not ranged or not total:
+        return [(f'{dst}.part0', 0, None)]
+    size = -(-total // DOWNLOAD_SEGMENTS)
+    return [(f'{dst}.part{i}', start, min(start + size, total) - 1)
+            for i, start in enumerate(range(0, total, size))]
+
+
+def _discard_parts(dst):
+    import glob
+    for path in glob.glob(glob.escape(dst) + '.part*'):
+        os.remove(path)
+
+
+def _fetch_segment(url, part, start, end, progress, cancel):
+    """Download bytes start..end of url into part, resuming from whatever part already holds."""
+    import urllib.request
+    if cancel.is_set():
+        return
+    have = os.path.getsize(part) if os.path.exists(part) else 0
+    if end is None or have > end - start + 1:
+        have = 0  # a plain GET cannot resume; an oversized part is stale
+    progress(have)
+    if end is not None and have == end - start + 1:
+        return
+
+    headers = {} if end is None else {'Range': f'bytes={start + have}-{end}'}
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=DOWNLOAD_TIMEOUT) as resp:
+        if end is not None and resp.status != 206:
+            raise OSError(f'{os.path.basename(part)}: server ignored range request')
+        with open(part, 'ab' if have else 'wb') as f:
+            while not cancel.is_set():
+                buf = resp.read(DOWNLOAD_CHUNK)
+                if not buf:
+                    break
+                f.write(buf)
+                progress(len(buf))
+
+    if end is not None and not cancel.is_set() and os.path.getsize(part) != end - start + 1:
+        raise OSError(f'{os.path.basename(part)}: connection closed early')
+
+
+def _assemble_download(dst, parts, total, sha256):
+    """Join part files into dst, checking size (and digest, if pinned) before an atomic rename.
+
+    Returns the size of the installed file."""
+    name = os.path.basename(dst)
+    h = hashlib.sha256() if sha256 else None
+    if len(parts) == 1:
+        tmp = parts[0]
+        with open(tmp, 'ab') as f:
+            os.fsync(f.fileno())
+        size = os.path.getsize(tmp)
+        digest = _sha256_file(tmp) if sha256 else None
+    else:
+        tmp = f'{dst}.part'
+        size = 0
+        with open(tmp, 'wb') as out:
+            for part in parts:
+                with open(part, 'rb') as f:
+                    for buf in iter(lambda: f.read(DOWNLOAD_CHUNK), b''):
+                        if h:
+                            h.update(buf)
+                        out.write(buf)
+                        size += len(buf)
+            out.flush()
+            os.fsync(out.fileno())
+        digest = h.hexdigest() if h else None
+
+    if total is not None and size != total:
+        problem = f'{size} bytes, expected {total}'
+    elif sha256 and digest != sha256:
+        problem = f'sha256 {digest[:12]}... does not match pinned digest'
+    else:
+        problem = None
+    if problem:
+        for path in set(parts + [tmp]):
+            os.remove(path)
+        raise OSError(f'{name}: verification failed ({problem}) -- partial files removed')
+
+    os.replace(tmp, dst)
+    for part in parts:
+        if os.path.exists(part):
+            os.remove(part)
+    return size
+
+
+def _warn_unpinned(filename, sha256):
+    if sha256 is None:
+        warn(f'{filename}: no pinned SHA-256 -- size-checked only, contents not verified')
+
+
+def _print_progress(done, total):
+    mb = 1024 * 1024
+    if total:
+        print(f'\r    {done / mb:6.1f} / {total / mb:.1f} MB  ({100 * done // total}%)',
+              end='', flush=True)
+    else:
+        print(f'\r    {done / mb:6.1f} MB', end='', flush=True)
+
+
+def download_models(models, dest_dir, digests=KOKORO_MODEL_SHA256, workers=DOWNLOAD_WORKERS):
+    """Download (url, filename) pairs into dest_dir over concurrent ranged requests.
+
+    Interrupted downloads resume from their .part files on the next run, as long as the
+    server still reports the same size and ETag for the asset. Each file is checked
+    against that size (and its pinned SHA-256, if any), fsynced and renamed into place,
+    then recorded in DOWNLOAD_RECORD_NAME. Files without a pinned digest are accepted
+    with a warning.
+    """
+    import threading
+    from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+
+    os.makedirs(dest_dir, exist_ok=True)
+    record = _load_download_record(dest_dir)
+    plans = []
+    for url, filename in models:
+        dst = os.path.join(dest_dir, filename)
+        sha256 = digests.get(filename)
+        if _model_file_ok(dst, sha256, _completed_size(record, filename)):
+            ok(f'{filename} (already downloaded)')
+            _warn_unpinned(filename, sha256)
+            continue
+
+        total, ranged, validator = _probe_download(url)
+        # A file with no record (manual download, older installer) is kept only if it is complete
+        if total and _model_file_ok(dst, sha256, total):
+            record[filename] = {'url': url, 'size': total, 'validator': validator, 'complete': True}
+            ok(f'{filename} (existing file matches server size)')
+            _warn_unpinned(filename, sha256)
+            continue
+
+        # Parts left by a different asset version must not be spliced into this one
+        previous = record.get(filename)
+        if (not total or not isinstance(previous, dict) or previous.get('complete')
+                or [previous.get('url'), previous.get('size'), previous.get('validator')]
+                != [url, total, validator]):
+            _discard_parts(dst)
+        record[filename] = {'url': url, 'size': total, 'validator': validator, 'complete': False}
+        plans.append((url, dst, sha256, total, _plan_segments(dst, total, ranged)))
+    _save_download_record(dest_dir, record)
+    if not plans:
+        return
+
+    lock = threading.Lock()
+    done = [0]
+    cancel = threading.Event()
+
+    def progress(n):
+        with lock:
+            done[0] += n
+
+    def fetch(url, part, start, end):
+        try:
+            _fetch_segment(url, part, start, end, progress, cancel)
+        except BaseException:
+            cancel.set()  # queued segments return without opening a connection
+            raise
+
+    grand_total = sum(total or 0 for _, _, _, total, _ in plans)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(fetch, url, part, start, end)
+                   for url, _, _, _, segments in plans for part, start, end in segments}
+        try:
+            while pending:
+                finished, pending = wait(pending, timeout=0.5, return_when=FIRST_EXCEPTION)
+                _print_progress(done[0], grand_total)
+                for future in finished:
+                    future.result()  # re-raise the first segment failure
+        except BaseException:
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            print()
+
+    for url, dst, sha256, total, segments in plans:
+        size = _assemble_download(dst, [part for part, _, _ in segments], total, sha256)
+        record[os.path.basename(dst)].update(size=size, complete=True)
+        _save_download_record(dest_dir, record)
+        ok(os.path.basename(dst))
+        _warn_unpinned(os.path.basename(dst), sha256)
 
 
 def offer_kokoro():
@@ -164,6 +501,8 @@ def offer_kokoro():
 
     if _kokoro_already_installed():
         ok(f'kokoro-onnx already installed at {KOKORO_GLOBAL_MODELS}')
+        for _, filename in KOKORO_MODEL_URLS:
+            _warn_unpinned(filename, KOKORO_MODEL_SHA256.get(filename))
         return
 
     print('    Edge TTS requires internet. kokoro-onnx is a local fallback that works offline.')
@@ -174,21 +513,17 @@ def offer_kokoro():
         return
 
     step('Installing kokoro-onnx...')
-    pip_install(KOKORO_PACKAGES)
+    if _missing_packages(KOKORO_PACKAGES):
+        pip_install(KOKORO_PACKAGES)
+        _missing_packages(KOKORO_PACKAGES)
     ok('kokoro-onnx installed')
 
     step(f'Downloading model files to {KOKORO_GLOBAL_MODELS}...')
-    os.makedirs(KOKORO_GLOBAL_MODELS, exist_ok=True)
     try:
-        import urllib.request
-        for url, filename in KOKORO_MODEL_URLS:
-            dst = os.path.join(KOKORO_GLOBAL_MODELS, filename)
-            print(f'    Downloading {filename}...')
-            urllib.request.urlretrieve(url, dst)
-            ok(filename)
+        download_models(KOKORO_MODEL_URLS, KOKORO_GLOBAL_MODELS)
     except Exception as e:
         fail(f'Model download failed: {e}')
-        print('    You can download manually -- see INSTALL.md for URLs.')
+        print('    Re-run the installer to resume, or download manually -- see INSTALL.md for URLs.')
 
 
 def _hook_command(script_name):
@@ -229,6 +564,15 @@ def patch_settings_json():
     stop_cmd   = _hook_command('stop.py')
     task_cmd   = _hook_command('task-hook.py')
     repeat_cmd = _hook_command('repeat.py')
+    statusline_cmd = _hook_command('statusline.py')
+
+    # Fast path: settings file untouched since the last install wrote these same commands
+    wanted = {'Stop': stop_cmd, 'PostToolUse': task_cmd,
+              'UserPromptSubmit': repeat_cmd, 'statusLine': statusline_cmd}
+    record = _manifest['settings'].get(SETTINGS_FILE)
+    if record and record.get('commands') == wanted and record.get('stat') == _stat_key(SETTINGS_FILE):
+        ok('settings already up to date')
+        return
 
     # Load existing settings (or start fresh)
     settings = {}
@@ -241,14 +585,13 @@ def patch_settings_json():
             warn('Skipping auto-patch. Add the hooks manually -- see INSTALL.md.')
             return
 
+    before = json.dumps(settings, sort_keys=True)
     hooks = settings.setdefault('hooks', {})
-    changed = False
 
     # Stop hook
     replaced = _set_hook(hooks, 'Stop', {
         'hooks': [{'type': 'command', 'command': stop_cmd}]
     })
-    changed = changed or replaced
     ok('Updated Stop hook' if replaced else 'Set Stop hook')
 
     # PostToolUse:Task hook
@@ -256,18 +599,15 @@ def patch_settings_json():
         'matcher': 'Task',
         'hooks': [{'type': 'command', 'command': task_cmd}]
     })
-    changed = changed or replaced
     ok('Updated PostToolUse:Task hook' if replaced else 'Set PostToolUse:Task hook')
 
     # UserPromptSubmit hook
     replaced = _set_hook(hooks, 'UserPromptSubmit', {
         'hooks': [{'type': 'command', 'command': repeat_cmd}]
     })
-    changed = changed or replaced
     ok('Updated UserPromptSubmit hook' if replaced else 'Set UserPromptSubmit hook')
 
     # Status line — chain to any existing command so we don't clobber the user's setup
-    statusline_cmd = _hook_command('statusline.py')
     existing_sl = settings.get('statusLine', {})
     existing_sl_cmd = existing_sl.get('command', '') if isinstance(existing_sl, dict) else ''
 
@@ -281,12 +621,13 @@ def patch_settings_json():
             ok(f'Saved existing statusLine command to statusline_chain.txt')
 
         settings['statusLine'] = {'type': 'command', 'command': statusline_cmd}
-        changed = True
         ok('Updated statusLine' if _is_ours else 'Added statusLine for TTS status display')
     else:
         ok('statusLine already configured')
 
-    if not changed:
+    # _set_hook re-appends our entries even when they're identical -- compare content instead
+    if json.dumps(settings, sort_keys=True) == before:
+        _manifest['settings'][SETTINGS_FILE] = {'commands': wanted, 'stat': _stat_key(SETTINGS_FILE)}
         ok('settings already up to date')
         return
 
@@ -299,6 +640,7 @@ def patch_settings_json():
     os.makedirs(os.path.dirname(SETTINGS_FILE), exist_ok=True)
     with open(SETTINGS_FILE, 'w', encoding='utf-8') as f:
         json.dump(settings, f, indent=2)
+    _manifest['settings'][SETTINGS_FILE] = {'commands': wanted, 'stat': _stat_key(SETTINGS_FILE)}
     ok(f'settings saved')
 
 
@@ -323,6 +665,82 @@ def _voices_json_has_pool():
         return False
 
 
+# Routing index written next to voices.json: everything a hook needs to pick a voice
+# (lowercase agent map, ordered project keys with their entries, default, session_pool),
+# stamped with the source mtime/size so a stale index is detected and ignored.
+VOICES_INDEX_NAME = 'voices.index.json'
+VOICES_INDEX_VERSION = 1
+_VOICES_RESERVED_KEYS = ('default', 'projects', 'session_pool')
+
+
+def build_voices_index(voices_path):
+    """Write VOICES_INDEX_NAME next to voices_path. Returns a list of ambiguity warnings.
+
+    Project keys are matched as case-insensitive substrings of the project path, first
+    listed key wins, so a key contained in another key (or equal to it ignoring case)
+    is reported as ambiguous.
+    """
+    with open(voices_path, 'r', encoding='utf-8') as f:
+        cfg = json.load(f)
+    st = os.stat(voices_path)
+
+    warnings = []
+    agents = {}
+    for name, entry in cfg.items():
+        if name in _VOICES_RESERVED_KEYS or not isinstance(entry, dict):
+            continue
+        key = name.lower()
+        if key in agents:
+            warnings.append(f'agent "{name}" duplicates another agent key (case-insensitive)')
+            continue
+        agents[key] = entry
+
+    projects = cfg.get('projects') if isinstance(cfg.get('projects'), dict) else {}
+    routes, names = [], {}
+    for name, entry in projects.items():
+        key = name.lower()
+        if not key or not isinstance(entry, dict):
+            continue
+        if key in names:
+            warnings.append(f'project "{name}" duplicates "{names[key]}" (case-insensitive)')
+            continue
+        names[key] = name
+        routes.append([key, entry])
+    for key, name in names.items():
+        for other, other_name in names.items():
+            if key != other and key in other:
+                warnings.append(f'project "{name}" is a substring of "{other_name}" '
+                                f'-- paths matching "{other_name}" also match "{name}"')
+
+    index = {
+        'version': VOICES_INDEX_VERSION,
+        'source': {'mtime_ns': st.st_mtime_ns, 'size': st.st_size},
+        'default': cfg.get('default', {}),
+        'agents': agents,
+        'projects': routes,
+        'session_pool': cfg.get('session_pool', []),
+        'ambiguous': warnings,
+    }
+    index_path = os.path.join(os.path.dirname(voices_path), VOICES_INDEX_NAME)
+    tmp = index_path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(index, f, separators=(',', ':'))
+    os.replace(tmp, index_path)
+    return warnings
+
+
+def _refresh_voices_index(voices_path):
+    """Rebuild the routing index for voices_path and report ambiguous project matches."""
+    try:
+        warnings = build_voices_index(voices_path)
+    except (OSError, ValueError) as e:
+        warn(f'Could not build {VOICES_INDEX_NAME}: {e}')
+        return
+    for w in warnings:
+        warn(f'voices.json: {w}')
+    ok(VOICES_INDEX_NAME)
+
+
 def offer_session_pool():
     step('Session pool (multi-instance voice assignment)')
 
@@ -352,6 +770,7 @@ def offer_session_pool():
     with open(voices_dst, 'w', encoding='utf-8') as f:
         json.dump(cfg, f, indent=2)
     ok(f'session_pool added with {len(pool)} voices')
+    _refresh_voices_index(voices_dst)
 
 
 def offer_claude_snippet():
@@ -459,6 +878,7 @@ def main():
 
     scope_label = 'global (~/.claude/)' if args.global_scope else 'project-local (.claude/)'
     print(f'\nclaude-code-tts installer  [{scope_label}]\n')
+    load_manifest()
     check_python()
     install_packages()
     create_dirs()
@@ -475,6 +895,7 @@ def main():
         offer_session_pool()
         offer_claude_snippet()
 
+    save_manifest()
     print_success()
 
 
@@ -0,0 +1,192 @@
+"""install.py model downloads against a local HTTP server stand-in (stdlib only)."""
+
+import contextlib
+import hashlib
+import http.server
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import install  # noqa: E402
+
+
+BIG = os.urandom(3 * 1024 * 1024 + 7)
+SMALL = os.urandom(1234)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server_state = None
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        state = self.server_state
+        body = state['files'][self.path]
+        rng = self.headers.get('Range')
+        state['ranges'].append(rng)
+        if rng and state['ranged']:
+            a, b = map(int, re.match(r'bytes=(\d+)-(\d+)', rng).groups())
+            chunk = body[a:b + 1]
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {a}-{b}/{len(body)}')
+        else:
+            chunk = body
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(chunk)))
+        self.send_header('ETag', state['etag'])
+        self.end_headers()
+        if state['truncate'] and len(chunk) > 1:
+            state['truncate'] -= 1
+            chunk = chunk[:len(chunk) // 2]
+        try:
+            self.wfile.write(chunk)
+        except ConnectionError:
+            pass
+
+
+class DownloadModelsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        handler = type('Handler', (_Handler,), {})
+        cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        cls.handler = handler
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        base = f'http://127.0.0.1:{cls.server.server_address[1]}'
+        cls.models = [(base + '/big.bin', 'big.bin'), (base + '/small.bin', 'small.bin')]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.state = {'files': {'/big.bin': BIG, '/small.bin': SMALL}, 'ranges': [],
+                      'ranged': True, 'truncate': 0, 'etag': '"v1"'}
+        self.handler.server_state = self.state
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.digests = {'big.bin': None, 'small.bin': None}
+
+    def download(self, models=None):
+        with contextlib.redirect_stdout(io.StringIO()):
+            install.download_models(models or self.models, self.dir, digests=self.digests)
+
+    def read(self, name):
+        with open(os.path.join(self.dir, name), 'rb') as f:
+            return f.read()
+
+    def record(self):
+        return install._load_download_record(self.dir)
+
+    def assertInstalled(self):
+        self.assertEqual(self.read('big.bin'), BIG)
+        self.assertEqual(self.read('small.bin'), SMALL)
+        self.assertEqual(sorted(os.listdir(self.dir)),
+                         ['big.bin', install.DOWNLOAD_RECORD_NAME, 'small.bin'])
+        record = self.record()
+        for name, data in (('big.bin', BIG), ('small.bin', SMALL)):
+            self.assertEqual(install._completed_size(record, name), len(data))
+            self.assertTrue(install._model_file_ok(os.path.join(self.dir, name), None, len(data)))
+
+    def test_ranged_download(self):
+        self.download()
+        self.assertInstalled()
+        segment = -(-len(BIG) // install.DOWNLOAD_SEGMENTS)
+        self.assertIn(f'bytes=0-{segment - 1}', self.state['ranges'])
+
+    def test_plain_get_fallback(self):
+        self.state['ranged'] = False
+        self.download()
+        self.assertInstalled()
+
+    def test_truncated_response_resumes(self):
+        self.state['truncate'] = 1
+        with self.assertRaises(Exception):
+            self.download(self.models[:1])
+        self.assertFalse(os.path.exists(os.path.join(self.dir, 'big.bin')))
+        self.assertIsNone(install._completed_size(self.record(), 'big.bin'))
+        self.download()
+        self.assertInstalled()
+
+    def test_failed_segment_stops_queued_segments(self):
+        self.state['truncate'] = 1
+        with self.assertRaises(Exception):
+            with contextlib.redirect_stdout(io.StringIO()):
+                install.download_models(self.models[:1], self.dir, digests=self.digests, workers=1)
+        # the probe plus the one failing segment -- queued segments never connect
+        self.assertEqual(len(self.state['ranges']), 2)
+
+    def test_unpinned_file_is_accepted_with_warning(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            install.download_models(self.models[:1], self.dir, digests=self.digests)
+        self.assertIn('WARN  big.bin: no pinned SHA-256', out.getvalue())
+
+    def test_resume_from_part_files(self):
+        dst = os.path.join(self.dir, 'big.bin')
+        segments = install._plan_segments(dst, len(BIG), True)
+        for part, start, end in segments[:2]:
+            with open(part, 'wb') as f:
+                f.write(BIG[start:start + 1000])
+        install._save_download_record(self.dir, {'big.bin': {
+            'url': self.models[0][0], 'size': len(BIG), 'validator': '"v1"', 'complete': False}})
+        self.download()
+        self.assertInstalled()
+        start, end = segments[0][1], segments[0][2]
+        self.assertIn(f'bytes={start + 1000}-{end}', self.state['ranges'])
+
+    def test_parts_from_other_asset_version_are_discarded(self):
+        dst = os.path.join(self.dir, 'big.bin')
+        for part, start, end in install._plan_segments(dst, len(BIG), True):
+            with open(part, 'wb') as f:
+                f.write(b'\0' * (end - start + 1))
+        install._save_download_record(self.dir, {'big.bin': {
+            'url': self.models[0][0], 'size': len(BIG), 'validator': '"v0"', 'complete': False}})
+        self.download()
+        self.assertInstalled()
+
+    def test_truncated_file_without_record_is_not_installed(self):
+        dst = os.path.join(self.dir, 'big.bin')
+        with open(dst, 'wb') as f:
+            f.write(BIG[:1000])
+        expected = install._completed_size(self.record(), 'big.bin')
+        self.assertFalse(install._model_file_ok(dst, None, expected))
+        self.download()
+        self.assertInstalled()
+
+    def test_complete_file_without_record_is_adopted(self):
+        with open(os.path.join(self.dir, 'big.bin'), 'wb') as f:
+            f.write(BIG)
+        self.download(self.models[:1])
+        self.assertEqual(install._completed_size(self.record(), 'big.bin'), len(BIG))
+        self.assertEqual(self.state['ranges'], ['bytes=0-0'])
+
+    def test_digest_mismatch_leaves_nothing_behind(self):
+        self.digests['big.bin'] = '0' * 64
+        with self.assertRaises(OSError):
+            self.download(self.models[:1])
+        self.assertEqual(os.listdir(self.dir), [install.DOWNLOAD_RECORD_NAME])
+
+    def test_pinned_digest_accepted(self):
+        self.digests = {'big.bin': hashlib.sha256(BIG).hexdigest(),
+                        'small.bin': hashlib.sha256(SMALL).hexdigest()}
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            install.download_models(self.models, self.dir, digests=self.digests)
+        self.assertNotIn('WARN', out.getvalue())
+        self.assertInstalled()
+        with open(os.path.join(self.dir, install.DOWNLOAD_RECORD_NAME), encoding='utf-8') as f:
+            self.assertTrue(json.load(f)['big.bin']['complete'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+"""install.py manifest-driven reinstall: skipped copies, settings fast path, no-op timing."""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import install  # noqa: E402
+
+
+_GLOBALS = ('INSTALL_DIR', 'MODELS_DIR', 'SKILL_INSTALL_DIR', 'SETTINGS_FILE',
+            'HOOKS_SOURCE', 'SKILL_SOURCE', 'REQUIRED_PACKAGES', 'pip_install', '_manifest')
+
+
+class ManifestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+        saved = {name: getattr(install, name) for name in _GLOBALS}
+        self.addCleanup(lambda: [setattr(install, k, v) for k, v in saved.items()])
+
+        hooks_src = os.path.join(self.root, 'src', 'hooks')
+        skill_src = os.path.join(self.root, 'src', 'skill')
+        os.makedirs(hooks_src)
+        os.makedirs(skill_src)
+        for name in install.HOOK_FILES:
+            self.write(os.path.join(hooks_src, name), f'# {name}\n')
+        self.write(os.path.join(hooks_src, 'voices.json'), '{"default": {"voice": "af_heart", "speed": 1.0}}')
+        for name in install.SKILL_FILES:
+            self.write(os.path.join(skill_src, name), f'{name}\n')
+
+        claude = os.path.join(self.root, 'proj', '.claude')
+        install.HOOKS_SOURCE = hooks_src
+        install.SKILL_SOURCE = skill_src
+        install.INSTALL_DIR = os.path.join(claude, 'hooks', 'tts')
+        install.MODELS_DIR = os.path.join(install.INSTALL_DIR, 'models')
+        install.SKILL_INSTALL_DIR = os.path.join(claude, 'skills', 'voice')
+        install.SETTINGS_FILE = os.path.join(claude, 'settings.local.json')
+        # packages every test interpreter has -- pip must never be spawned
+        install.REQUIRED_PACKAGES = ['pip']
+        install.pip_install = lambda packages: self.fail(f'pip_install called for {packages}')
+        os.makedirs(install.INSTALL_DIR)
+
+    def write(self, path, text):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def read(self, path):
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+
+    def quiet(self, *steps):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            for fn in steps:
+                fn()
+        return out.getvalue()
+
+    def reinstall(self):
+        """The non-interactive part of main(), in order."""
+        return self.quiet(install.load_manifest, install.install_packages, install.create_dirs,
+                          install.copy_files, install.copy_skill, install.patch_settings_json,
+                          install.save_manifest)
+
+    def test_unchanged_file_is_skipped(self):
+        self.reinstall()
+        out = self.reinstall()
+        for name in install.HOOK_FILES + install.SKILL_FILES:
+            self.assertIn(f'OK  {name} (unchanged)', out)
+        self.assertIn('already installed -- skipping pip', out)
+
+    def test_edited_installed_file_is_copied_again(self):
+        self.reinstall()
+        dst = os.path.join(install.INSTALL_DIR, 'stop.py')
+        self.write(dst, '# local edit\n')
+        out = self.reinstall()
+        self.assertIn('OK  stop.py\n', out)
+        self.assertEqual(self.read(dst), '# stop.py\n')
+
+    def test_deleted_installed_file_is_copied_again(self):
+        self.reinstall()
+        dst = os.path.join(install.SKILL_INSTALL_DIR, 'read.md')
+        os.remove(dst)
+        out = self.reinstall()
+        self.assertIn('OK  read.md\n', out)
+        self.assertEqual(self.read(dst), 'read.md\n')
+
+    def test_changed_source_file_is_copied(self):
+        self.reinstall()
+        self.write(os.path.join(install.HOOKS_SOURCE, 'daemon.py'), '# daemon.py v2\n')
+        self.reinstall()
+        self.assertEqual(self.read(os.path.join(install.INSTALL_DIR, 'daemon.py')), '# daemon.py v2\n')
+
+    def test_unchanged_settings_not_backed_up_or_rewritten(self):
+        self.reinstall()
+        before = os.stat(install.SETTINGS_FILE).st_mtime_ns
+        self.reinstall()
+        self.assertEqual(os.stat(install.SETTINGS_FILE).st_mtime_ns, before)
+        self.assertFalse(os.path.exists(install.SETTINGS_FILE + '.bak'))
+
+    def test_settings_edited_since_last_run_takes_slow_path(self):
+        self.reinstall()
+        settings = json.loads(self.read(install.SETTINGS_FILE))
+        del settings['hooks']['Stop']
+        settings['model'] = 'opus'
+        self.write(install.SETTINGS_FILE, json.dumps(settings))
+        self.reinstall()
+        patched = json.loads(self.read(install.SETTINGS_FILE))
+        self.assertIn('Stop', patched['hooks'])
+        self.assertEqual(patched['model'], 'opus')
+        self.assertTrue(os.path.exists(install.SETTINGS_FILE + '.bak'))
+
+    def test_settings_edit_that_keeps_our_hooks_is_not_rewritten(self):
+        self.reinstall()
+        settings = json.loads(self.read(install.SETTINGS_FILE))
+        settings['model'] = 'opus'
+        text = json.dumps(settings)
+        self.write(install.SETTINGS_FILE, text)
+        out = self.reinstall()
+        self.assertIn('settings already up to date', out)
+        self.assertEqual(self.read(install.SETTINGS_FILE), text)
+        self.assertFalse(os.path.exists(install.SETTINGS_FILE + '.bak'))
+
+    def test_corrupt_manifest_is_tolerated(self):
+        self.reinstall()
+        path = os.path.join(install.INSTALL_DIR, install.MANIFEST_NAME)
+        self.write(path, '{not json')
+        out = self.reinstall()
+        self.assertIn('OK  stop.py\n', out)  # nothing trusted -- everything copied again
+        manifest = json.loads(self.read(path))
+        self.assertIn(os.path.join(install.INSTALL_DIR, 'stop.py'), manifest['files'])
+
+        self.write(path, '["wrong shape"]')
+        self.reinstall()
+        self.assertIsInstance(json.loads(self.read(path))['files'], dict)
+
+    def test_noop_reinstall_is_well_under_a_second(self):
+        self.reinstall()
+        start = time.perf_counter()
+        self.reinstall()
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""install.py voices.json routing index."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import install  # noqa: E402
+
+
+class BuildVoicesIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir, True)
+        self.voices = os.path.join(self.dir, 'voices.json')
+
+    def build(self, cfg):
+        with open(self.voices, 'w', encoding='utf-8') as f:
+            json.dump(cfg, f)
+        warnings = install.build_voices_index(self.voices)
+        with open(os.path.join(self.dir, install.VOICES_INDEX_NAME), encoding='utf-8') as f:
+            return json.load(f), warnings
+
+    def test_index_routes_without_voices_json(self):
+        index, warnings = self.build({
+            'default': {'voice': 'af_heart', 'speed': 1.0},
+            'Code-Reviewer': {'voice': 'am_onyx', 'speed': 0.9},
+            'projects': {'MyProject': {'voice': 'af_nova', 'speed': 1.0},
+                         'another-repo': {'voice': 'af_sarah', 'speed': 1.0}},
+            'session_pool': ['am_echo', 'bf_sonia'],
+        })
+        self.assertEqual(warnings, [])
+        self.assertEqual(index['default'], {'voice': 'af_heart', 'speed': 1.0})
+        self.assertEqual(index['agents'], {'code-reviewer': {'voice': 'am_onyx', 'speed': 0.9}})
+        self.assertEqual(index['projects'], [['myproject', {'voice': 'af_nova', 'speed': 1.0}],
+                                             ['another-repo', {'voice': 'af_sarah', 'speed': 1.0}]])
+        self.assertEqual(index['session_pool'], ['am_echo', 'bf_sonia'])
+        st = os.stat(self.voices)
+        self.assertEqual(index['source'], {'mtime_ns': st.st_mtime_ns, 'size': st.st_size})
+
+    def test_ambiguous_and_duplicate_keys_are_reported(self):
+        index, warnings = self.build({
+            'Reviewer': {'voice': 'am_onyx'},
+            'reviewer': {'voice': 'am_adam'},
+            'projects': {'MyProject': {'voice': 'a'}, 'MyProject-api': {'voice': 'b'},
+                         'Other': {'voice': 'c'}, 'other': {'voice': 'd'}},
+        })
+        self.assertEqual(len(warnings), 3)
+        self.assertEqual(index['ambiguous'], warnings)
+        self.assertEqual(index['agents'], {'reviewer': {'voice': 'am_onyx'}})
+        self.assertEqual([key for key, _ in index['projects']], ['myproject', 'myproject-api', 'other'])
+
+
+if __name__ == '__main__':
+    unittest.main()